@@ -3,26 +3,16 @@ import asyncio
 import sys
 import argparse
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
-import yaml
-import pytz
 
 from .core.connector import ArxivZoteroCollector
 from .core.search_params import ArxivSearchParams
 from .utils.credentials import load_credentials, CredentialsError
 from .utils.summarizer import PaperSummarizer
+from .utils.logging_setup import configure_logging, shutdown_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('arxiv_zotero.log', mode='a', encoding='utf-8')
-    ]
-)
 logger = logging.getLogger(__name__)
 
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -32,12 +22,15 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     try:
         # Add timezone awareness to parsed date
         parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-        return parsed_date.replace(tzinfo=pytz.UTC)  # Make timezone-aware
+        return parsed_date.replace(tzinfo=timezone.utc)  # Make timezone-aware
     except ValueError:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
         
 def load_yaml_config(config_path: Path) -> dict:
     """Load search parameters from YAML configuration file"""
+    # Imported here so runs without --config skip the yaml import cost
+    import yaml
+
     try:
         with open(config_path, 'r') as f:
             return yaml.safe_load(f)
@@ -177,7 +170,11 @@ async def async_main():
 
 def main():
     """Main entry point for the CLI"""
-    exit_code = asyncio.run(async_main())
+    configure_logging()
+    try:
+        exit_code = asyncio.run(async_main())
+    finally:
+        shutdown_logging()
     sys.exit(exit_code)
 
 if __name__ == "__main__":
@@ -1,74 +1,107 @@
 import arxiv
+import asyncio
 from datetime import datetime
 import logging
-import pytz
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import asyncio
+import operator
+import re
 from typing import List, Dict, Optional
 
 from ..core.search_params import ArxivSearchParams
 
 logger = logging.getLogger(__name__)
 
+# Content-type keyword patterns, compiled once; IGNORECASE avoids
+# lower-casing both fields on every result
+_CONF_RE = re.compile(r'conference|proceedings', re.IGNORECASE)
+_PREPRINT_RE = re.compile(r'preprint|submitted', re.IGNORECASE)
+
+# Fields every arxiv.Result carries, fetched in one C-level tuple access
+# instead of a chain of Python-level attribute lookups per paper
+_ARXIV_GET = operator.attrgetter(
+    'title', 'summary', 'authors', 'published', 'entry_id',
+    'pdf_url', 'primary_category', 'categories'
+)
+
 class ArxivClient:
     """Class to handle all arXiv-specific operations"""
-    
+
+    # One arxiv.Client per process: its internal HTTP session and
+    # inter-request pacing state survive across collector instances
+    _shared_client = None
+
     def __init__(self):
         """Initialize the ArxivClient"""
-        self.client = arxiv.Client(
-            page_size=100,
-            delay_seconds=3,
-            num_retries=5
-        )
+        if ArxivClient._shared_client is None:
+            ArxivClient._shared_client = arxiv.Client(
+                page_size=100,
+                delay_seconds=3,
+                num_retries=5
+            )
+        self.client = ArxivClient._shared_client
 
     def filter_by_date(self, result: arxiv.Result, start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
         """Filter arxiv result by date range"""
         if not (start_date or end_date):
             return True
-            
-        pub_date = result.published.astimezone(pytz.UTC)
-        
+
+        # result.published is already tz-aware UTC, and the bounds are
+        # normalized to UTC when ArxivSearchParams is built, so the dates
+        # compare directly without a per-result astimezone conversion
+        pub_date = result.published
+
         if start_date and pub_date < start_date:
             return False
         if end_date and pub_date > end_date:
             return False
-            
+
         return True
 
+    @staticmethod
+    def _is_journal(comment: str, journal_ref: str) -> bool:
+        return bool(journal_ref and not _PREPRINT_RE.search(journal_ref))
+
+    @staticmethod
+    def _is_conference(comment: str, journal_ref: str) -> bool:
+        return bool(_CONF_RE.search(comment) or _CONF_RE.search(journal_ref))
+
+    @staticmethod
+    def _is_preprint(comment: str, journal_ref: str) -> bool:
+        return not journal_ref
+
+    _CONTENT_TYPE_FILTERS = {
+        'journal': _is_journal.__func__,
+        'conference': _is_conference.__func__,
+        'preprint': _is_preprint.__func__,
+    }
+
     def filter_by_content_type(self, result: arxiv.Result, content_type: Optional[str]) -> bool:
         """Filter arxiv result by content type"""
         if not content_type:
             return True
-            
+
+        check = self._CONTENT_TYPE_FILTERS.get(content_type)
+        if check is None:
+            return True
+
         comment = getattr(result, 'comment', '') or ''
         journal_ref = getattr(result, 'journal_ref', '') or ''
-        
-        comment = comment.lower()
-        journal_ref = journal_ref.lower()
-        
-        if content_type == 'journal':
-            return bool(journal_ref and not ('preprint' in journal_ref or 'submitted' in journal_ref))
-        elif content_type == 'conference':
-            return bool('conference' in comment or 'proceedings' in comment or 
-                    'conference' in journal_ref or 'proceedings' in journal_ref)
-        elif content_type == 'preprint':
-            return not bool(journal_ref)
-            
-        return True
+        return check(comment, journal_ref)
 
-    async def _prepare_arxiv_metadata(self, result: arxiv.Result) -> Optional[Dict]:
+    def _prepare_arxiv_metadata(self, result: arxiv.Result) -> Optional[Dict]:
         """Prepare metadata from arxiv result"""
         try:
+            (title, summary, authors, published, entry_id,
+             pdf_url, primary_category, categories) = _ARXIV_GET(result)
             return {
-                'title': result.title,
-                'abstract': result.summary,
-                'authors': [author.name for author in result.authors],
-                'published': result.published.strftime('%Y-%m-%d') if isinstance(result.published, datetime) else result.published,
-                'arxiv_id': result.entry_id.split('/')[-1],
-                'arxiv_url': result.entry_id,
-                'pdf_url': result.pdf_url,
-                'primary_category': result.primary_category,
-                'categories': result.categories,
+                'title': title,
+                'abstract': summary,
+                'authors': [author.name for author in authors],
+                'published': published.strftime('%Y-%m-%d') if isinstance(published, datetime) else published,
+                'arxiv_id': entry_id.split('/')[-1],
+                'arxiv_url': entry_id,
+                'pdf_url': pdf_url,
+                'primary_category': primary_category,
+                'categories': categories,
                 'journal_ref': getattr(result, 'journal_ref', None),
                 'doi': getattr(result, 'doi', None),
                 'comment': getattr(result, 'comment', None)
@@ -77,8 +110,16 @@ class ArxivClient:
             logger.error(f"Error preparing arxiv metadata: {str(e)}")
             return None
 
-    def search_arxiv(self, search_params: ArxivSearchParams) -> List[Dict]:
-        """Search arXiv using provided search parameters"""
+    def search_arxiv(self, search_params: ArxivSearchParams, skip_ids=None) -> List[Dict]:
+        """
+        Search arXiv using provided search parameters
+
+        Args:
+            search_params: Search parameters to build the query from
+            skip_ids: Optional container of arXiv IDs to drop from the
+                      stream (e.g. the persistent paper cache), checked
+                      before any filtering work is done per result
+        """
         try:
             query = search_params.build_query()
             logger.info(f"Executing arXiv search with query: {query}")
@@ -90,31 +131,42 @@ class ArxivClient:
             )
             
             papers = []
-            
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-                
-                for result in self.client.results(search):
-                    if not self.filter_by_date(result, search_params.start_date, search_params.end_date):
-                        continue
-                        
-                    if not self.filter_by_content_type(result, search_params.content_type):
-                        continue
-                    
-                    future = executor.submit(
-                        asyncio.run,
-                        self._prepare_arxiv_metadata(result)
-                    )
-                    futures.append(future)
-                
-                for future in as_completed(futures):
-                    paper_metadata = future.result()
-                    if paper_metadata:
-                        papers.append(paper_metadata)
-            
+
+            # Metadata preparation is plain attribute copying, so it runs
+            # inline; threading it only added executor and event-loop overhead
+            for result in self.client.results(search):
+                # Results arrive newest-first (SubmittedDate descending), so
+                # the first one older than start_date ends the search — no
+                # point paging through the rest with 3 s inter-page delays
+                if search_params.start_date and result.published < search_params.start_date:
+                    break
+
+                if skip_ids is not None and result.entry_id.split('/')[-1] in skip_ids:
+                    continue
+
+                if not self.filter_by_date(result, search_params.start_date, search_params.end_date):
+                    continue
+
+                if not self.filter_by_content_type(result, search_params.content_type):
+                    continue
+
+                paper_metadata = self._prepare_arxiv_metadata(result)
+                if paper_metadata:
+                    papers.append(paper_metadata)
+
             logger.info(f"Found {len(papers)} papers matching the search criteria")
             return papers
-            
+
         except Exception as e:
             logger.error(f"Error searching arXiv: {str(e)}")
             return []
+
+    async def search_arxiv_async(self, search_params: ArxivSearchParams, skip_ids=None) -> List[Dict]:
+        """
+        Run the blocking arXiv search in a worker thread
+
+        The arxiv library pages results synchronously with a built-in
+        inter-page delay; running it off the event loop keeps other work
+        (downloads, Zotero writes) flowing while pages arrive.
+        """
+        return await asyncio.to_thread(self.search_arxiv, search_params, skip_ids)
@@ -1,59 +1,230 @@
-from collections import deque
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from pyzotero import zotero
 from typing import List, Dict, Optional, Tuple
+import aiohttp
+import asyncio
+import copy
 import logging
-import requests
+import random
 import time
 
+from ..utils.pdf_manager import USER_AGENT
+from ..utils.rate_limiter import AsyncTokenBucket
+
+try:
+    import orjson
+
+    def _json_dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:  # orjson is an optional speedup; stdlib json works too
+    import json
+
+    def _json_dumps(payload) -> bytes:
+        return json.dumps(payload).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+ZOTERO_API_BASE = 'https://api.zotero.org'
+
+# Maximum number of items the Zotero write API accepts per request
+ZOTERO_BATCH_SIZE = 50
+
+# Collection listings rarely change mid-run; cache the key sets per library
+# so repeated collector constructions in one process skip the paginated GET
+COLLECTIONS_CACHE_TTL = 3600
+_COLLECTIONS_CACHE: Dict[str, Tuple[float, frozenset]] = {}
+
 class ZoteroAPIError(Exception):
     """Custom exception for Zotero API errors"""
     pass
 
 class ZoteroClient:
     """Class to handle all Zotero-specific operations"""
-    
+
     def __init__(self, library_id: str, api_key: str, collection_key: str = None):
         """
         Initialize the Zotero client
-        
+
         Args:
             library_id: Zotero library identifier
             api_key: Zotero API key
             collection_key: Optional collection key to add items to
         """
+        self.library_id = library_id
+        self.api_key = api_key
         self.zot = zotero.Zotero(library_id, 'user', api_key)
         self.collection_key = collection_key
-        
-        # Configure HTTP session for better performance
-        self.session = requests.Session()
-        self.session.mount('https://', requests.adapters.HTTPAdapter(
-            max_retries=3,
-            pool_connections=10,
-            pool_maxsize=20
-        ))
-        
-        # Rate limiting support
-        self.request_times = deque(maxlen=10)
-        self.min_request_interval = 0.1
-        
-        if collection_key:
-            self._validate_collection()
+        self.async_session = None
+        self._valid_collection_keys = None
+        self._template_cache = {}
+
+        # Rate limiting: Zotero allows short bursts but throttles sustained
+        # write traffic, so keep a modest bucket
+        self._rate_limiter = AsyncTokenBucket(capacity=10, rate=5.0)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the shared aiohttp session used for direct Zotero REST calls
+
+        Returns:
+            aiohttp.ClientSession: Long-lived session with Zotero API headers
+        """
+        if self.async_session is None or self.async_session.closed:
+            self.async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                headers={
+                    'Zotero-API-Key': self.api_key,
+                    'Zotero-API-Version': '3',
+                    'User-Agent': USER_AGENT
+                }
+            )
+        return self.async_session
+
+    async def create_items_async(self, templates: List[Dict]) -> List[Optional[str]]:
+        """
+        Create multiple items through batched Zotero REST requests
+
+        The Zotero write API accepts up to 50 items per POST, so the input is
+        sliced into batches of that size — one request per 50 items instead of
+        one round-trip per item.
+
+        Args:
+            templates: List of item templates to create
+
+        Returns:
+            List[Optional[str]]: Item keys aligned with the input templates,
+                                 None for entries that failed
+        """
+        if not templates:
+            return []
+
+        item_keys: List[Optional[str]] = []
+        for start in range(0, len(templates), ZOTERO_BATCH_SIZE):
+            batch = templates[start:start + ZOTERO_BATCH_SIZE]
+            item_keys.extend(await self._create_items_batch(batch))
+
+        created = sum(1 for key in item_keys if key)
+        logger.info(f"Batch created {created}/{len(templates)} Zotero items")
+        return item_keys
+
+    async def _create_items_batch(self, templates: List[Dict]) -> List[Optional[str]]:
+        """
+        POST a single batch of at most ZOTERO_BATCH_SIZE item templates
+
+        Args:
+            templates: Item templates for one request
+
+        Returns:
+            List[Optional[str]]: Item keys aligned with the input templates
+        """
+        try:
+            session = await self._get_session()
+            url = f'{ZOTERO_API_BASE}/users/{self.library_id}/items'
+
+            for attempt in range(3):
+                await self._rate_limiter.acquire()
+                async with session.post(
+                    url,
+                    data=_json_dumps(templates),
+                    headers={'Content-Type': 'application/json'}
+                ) as response:
+                    if response.status in (429, 503):
+                        # Back off with jitter and drain the bucket so other
+                        # in-flight callers pause too
+                        retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+                        logger.warning(f"Zotero rate limit hit, backing off {retry_after:.1f}s")
+                        await self._rate_limiter.penalize(retry_after)
+                        await asyncio.sleep(retry_after + random.uniform(0, 1))
+                        continue
+                    if response.status != 200:
+                        body = await response.text()
+                        raise ZoteroAPIError(
+                            f"Batch item creation failed with status {response.status}: {body}"
+                        )
+                    # Zotero signals pre-emptive throttling with a Backoff
+                    # header on successful responses; drain the bucket so
+                    # every in-flight caller slows down before a 429 lands
+                    backoff = response.headers.get('Backoff')
+                    if backoff:
+                        logger.info(f"Zotero requested a {backoff}s backoff")
+                        await self._rate_limiter.penalize(float(backoff))
+                    result = await response.json()
+                    break
+            else:
+                raise ZoteroAPIError("Batch item creation failed: rate limit retries exhausted")
+
+            item_keys: List[Optional[str]] = [None] * len(templates)
+
+            for index, entry in result.get('successful', {}).items():
+                item_keys[int(index)] = entry['key']
+            for index, key in result.get('unchanged', {}).items():
+                item_keys[int(index)] = key
+            for index, failure in result.get('failed', {}).items():
+                logger.error(f"Failed to create item {index} in batch: {failure}")
+
+            return item_keys
+
+        except ZoteroAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"Error creating Zotero items in batch: {str(e)}")
+            raise ZoteroAPIError(f"Failed to create Zotero items in batch: {str(e)}")
+
+    @classmethod
+    def invalidate_collections_cache(cls, library_id: str = None):
+        """
+        Drop the cached collection listing for one library (or all of them)
+
+        Call this after creating or deleting collections so the next
+        validation refetches the listing instead of waiting out the TTL.
+        """
+        if library_id is None:
+            _COLLECTIONS_CACHE.clear()
+        else:
+            _COLLECTIONS_CACHE.pop(library_id, None)
 
-    def _validate_collection(self):
+    async def validate_collection_async(self):
         """
         Validate that the specified collection exists
-        
+
         Raises:
             ValueError: If collection does not exist
         """
+        if not self.collection_key:
+            return
+
         try:
-            collections = self.zot.collections()
-            if not any(col['key'] == self.collection_key for col in collections):
+            # Fetch the collection list at most once per TTL per library and
+            # keep the keys as a frozenset so repeated runs — including new
+            # client instances in a long-lived process — validate with an
+            # O(1) lookup instead of a paginated listing
+            if self._valid_collection_keys is None:
+                cached = _COLLECTIONS_CACHE.get(self.library_id)
+                if cached and time.monotonic() - cached[0] < COLLECTIONS_CACHE_TTL:
+                    self._valid_collection_keys = cached[1]
+                else:
+                    session = await self._get_session()
+                    url = f'{ZOTERO_API_BASE}/users/{self.library_id}/collections'
+
+                    await self._rate_limiter.acquire()
+                    async with session.get(url) as response:
+                        if response.status != 200:
+                            raise ZoteroAPIError(
+                                f"Failed to fetch collections: status {response.status}"
+                            )
+                        collections = await response.json()
+
+                    self._valid_collection_keys = frozenset(col['key'] for col in collections)
+                    _COLLECTIONS_CACHE[self.library_id] = (time.monotonic(), self._valid_collection_keys)
+
+            if self.collection_key not in self._valid_collection_keys:
                 raise ValueError(f"Collection {self.collection_key} does not exist")
             logger.info(f"Successfully validated collection {self.collection_key}")
         except Exception as e:
@@ -89,13 +260,17 @@ class ZoteroClient:
             logger.error(f"Error creating Zotero item: {str(e)}")
             raise ZoteroAPIError(f"Failed to create Zotero item: {str(e)}")
 
-    def add_to_collection(self, item_key: str) -> bool:
+    def add_to_collection(self, item_key: str, version: int = None) -> bool:
         """
         Add an item to the specified collection
-        
+
         Args:
             item_key: Key of the item to add
-            
+            version: Known item version, e.g. from the create response.
+                     When given, a minimal patch payload is built locally
+                     and the per-item GET is skipped; only safe for items
+                     that are not yet in any collection.
+
         Returns:
             bool: True if successful, False otherwise
         """
@@ -103,7 +278,10 @@ class ZoteroClient:
             return True
 
         try:
-            item = self.zot.item(item_key)
+            if version is not None:
+                item = {'key': item_key, 'version': version, 'data': {'collections': []}}
+            else:
+                item = self.zot.item(item_key)
             success = self.zot.addto_collection(self.collection_key, item)
             
             if success:
@@ -165,6 +343,92 @@ class ZoteroClient:
             logger.error(f"Error uploading attachment: {str(e)}")
             raise ZoteroAPIError(f"Failed to upload attachment: {str(e)}")
 
+    async def get_item_template(self, template_type: str, linkmode: str = None) -> Dict:
+        """
+        Fetch an item template, cached for the lifetime of the client
+
+        Templates are static per Zotero schema version, so pyzotero's HTTP GET
+        is paid once per template type instead of once per paper.
+
+        Args:
+            template_type: Type of Zotero item ('journalArticle', 'attachment', etc.)
+            linkmode: Optional link mode for attachment templates
+
+        Returns:
+            Dict: A fresh copy of the template, safe for callers to mutate
+        """
+        cache_key = (template_type, linkmode)
+        if cache_key not in self._template_cache:
+            if linkmode:
+                template = await asyncio.to_thread(self.zot.item_template, template_type, linkmode)
+            else:
+                template = await asyncio.to_thread(self.zot.item_template, template_type)
+            self._template_cache[cache_key] = template
+        return copy.deepcopy(self._template_cache[cache_key])
+
+    async def upload_attachments_async(self, attachments: List[Dict]) -> set:
+        """
+        Upload multiple file attachments in a single batched call
+
+        Args:
+            attachments: List of attachment templates, each carrying its
+                         parentItem key
+
+        Returns:
+            set: parentItem keys whose attachment was uploaded (or already
+                 present and unchanged)
+        """
+        if not attachments:
+            return set()
+
+        try:
+            result = await asyncio.to_thread(self.zot.upload_attachments, attachments)
+
+            if not result:
+                logger.error("No result returned from upload_attachments")
+                return set()
+
+            uploaded = set()
+            for entry in list(result.get('success', [])) + list(result.get('unchanged', [])):
+                parent = entry.get('parentItem') if isinstance(entry, dict) else None
+                if parent:
+                    uploaded.add(parent)
+            for failure in result.get('failure', []):
+                logger.error(f"Failed to upload attachment: {failure}")
+
+            logger.info(f"Uploaded {len(uploaded)}/{len(attachments)} attachments in one batch")
+            return uploaded
+
+        except Exception as e:
+            logger.error(f"Error uploading attachments: {str(e)}")
+            raise ZoteroAPIError(f"Failed to upload attachments: {str(e)}")
+
+    async def fetch_existing_arxiv_ids(self) -> set:
+        """
+        Scan the library once for arXiv IDs that are already imported
+
+        The mapping stores the arXiv ID in archiveLocation, so one paginated
+        listing at startup lets re-runs skip item creation and multi-MB PDF
+        downloads for papers the library already has.
+
+        Returns:
+            set: arXiv IDs present in the library
+        """
+        try:
+            items = await asyncio.to_thread(
+                lambda: self.zot.everything(self.zot.items(itemType='journalArticle'))
+            )
+            existing = {
+                item['data']['archiveLocation']
+                for item in items
+                if item.get('data', {}).get('archiveLocation')
+            }
+            logger.info(f"Found {len(existing)} existing arXiv items in the library")
+            return existing
+        except Exception as e:
+            logger.warning(f"Could not fetch existing arXiv IDs: {str(e)}")
+            return set()
+
     def check_duplicate(self, identifier: str, identifier_field: str = 'DOI') -> Optional[str]:
         """
         Check if an item already exists in the library
@@ -225,6 +489,7 @@ class ZoteroClient:
             
             if collections:
                 collection_key = collections['successful']['0']['key']
+                self.invalidate_collections_cache(self.library_id)
                 logger.info(f"Successfully created collection: {collection_key}")
                 return collection_key
             return None
@@ -233,11 +498,7 @@ class ZoteroClient:
             logger.error(f"Error creating collection: {str(e)}")
             return None
 
-    def close(self):
-        """Cleanup resources"""
-        if self.session:
-            self.session.close()
-
-    def __del__(self):
-        """Cleanup resources on deletion"""
-        self.close()
\ No newline at end of file
+    async def close_async(self):
+        """Cleanup async resources"""
+        if self.async_session and not self.async_session.closed:
+            await self.async_session.close()
\ No newline at end of file
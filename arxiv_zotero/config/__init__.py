@@ -1,3 +1,3 @@
-from .arxiv_config import ARXIV_TO_ZOTERO_MAPPING
+from .arxiv_config import ARXIV_FIELD_SPECS, ARXIV_TO_ZOTERO_MAPPING, FieldSpec
 
-__all__ = ['ARXIV_TO_ZOTERO_MAPPING']
\ No newline at end of file
+__all__ = ['ARXIV_FIELD_SPECS', 'ARXIV_TO_ZOTERO_MAPPING', 'FieldSpec']
\ No newline at end of file
@@ -1,89 +1,63 @@
-ARXIV_TO_ZOTERO_MAPPING = {
+from collections import namedtuple
+
+from .metadata_config import (
+    clean_latex_markup,
+    extract_issue,
+    extract_journal_abbrev,
+    extract_journal_name,
+    extract_pages,
+    extract_volume,
+    get_current_date,
+    transform_creators,
+    transform_extra,
+    transform_tags,
+)
+
+# Flat field specification for mapping arXiv metadata to Zotero fields.
+# A tuple of namedtuples iterates faster and more predictably than the
+# previous dict-of-dicts with variable shape.
+FieldSpec = namedtuple(
+    'FieldSpec',
+    ('target', 'source', 'transformer', 'required', 'use_default', 'default'),
+    defaults=(None, False, False, None)
+)
+
+ARXIV_FIELD_SPECS = (
     # Basic metadata (required fields)
-    'title': {
-        'source_field': 'title',
-        'required': True,
-        'transformer': 'clean_latex_markup'
-    },
-    'creators': {
-        'source_field': 'authors',
-        'required': True,
-        'transformer': 'transform_creators'
-    },
-    'url': {
-        'source_field': 'arxiv_url',
-        'required': True
-    },
-    
+    FieldSpec('title', 'title', clean_latex_markup, required=True),
+    FieldSpec('creators', 'authors', transform_creators, required=True),
+    FieldSpec('url', 'arxiv_url', required=True),
+
     # Additional metadata (all optional)
-    'abstractNote': {
-        'source_field': 'abstract',
-        'required': False,
-        'transformer': 'clean_latex_markup'
-    },
-    'DOI': {
-        'source_field': 'doi',
-        'required': False
-    },
-    'journalAbbreviation': {
-        'source_field': 'journal_ref',
-        'required': False,
-        'transformer': 'extract_journal_abbrev'
-    },
-    'publicationTitle': {
-        'source_field': 'journal_ref',
-        'required': False,
-        'transformer': 'extract_journal_name'
-    },
-    'volume': {
-        'source_field': 'journal_ref',
-        'required': False,
-        'transformer': 'extract_volume'
-    },
-    'issue': {
-        'source_field': 'journal_ref',
-        'required': False,
-        'transformer': 'extract_issue'
-    },
-    'pages': {
-        'source_field': 'journal_ref',
-        'required': False,
-        'transformer': 'extract_pages'
-    },
-    'archive': {
-        'source_field': None,
-        'required': False,
-        'default_value': 'arXiv',
-        'use_default': True
-    },
-    'archiveLocation': {
-        'source_field': 'arxiv_id',  # Changed from primary_category to arxiv_id
-        'required': False
-    },
-    'libraryCatalog': {
-        'source_field': None,
-        'required': False,
-        'default_value': 'arXiv.org',
-        'use_default': True
-    },
-    'tags': {
-        'source_field': 'categories',
-        'required': False,
-        'transformer': 'transform_tags'
-    },
-    'extra': {
-        'source_field': ['comment', 'version', 'primary_category', 'arxiv_id'],  # Added arxiv_id and primary_category
-        'required': False,
-        'transformer': 'transform_extra'
-    },
-    'accessDate': {
-        'source_field': None,
-        'required': False,
-        'transformer': 'get_current_date',
-        'use_default': True
-    },
-    'rights': {
-        'source_field': 'license',
-        'required': False
-    }
-}
+    FieldSpec('abstractNote', 'abstract', clean_latex_markup),
+    FieldSpec('DOI', 'doi'),
+    FieldSpec('journalAbbreviation', 'journal_ref', extract_journal_abbrev),
+    FieldSpec('publicationTitle', 'journal_ref', extract_journal_name),
+    FieldSpec('volume', 'journal_ref', extract_volume),
+    FieldSpec('issue', 'journal_ref', extract_issue),
+    FieldSpec('pages', 'journal_ref', extract_pages),
+    FieldSpec('archive', None, use_default=True, default='arXiv'),
+    FieldSpec('archiveLocation', 'arxiv_id'),
+    FieldSpec('libraryCatalog', None, use_default=True, default='arXiv.org'),
+    FieldSpec('tags', 'categories', transform_tags),
+    FieldSpec('extra', ['comment', 'version', 'primary_category', 'arxiv_id'], transform_extra),
+    FieldSpec('accessDate', None, get_current_date, use_default=True),
+    FieldSpec('rights', 'license'),
+)
+
+def _as_mapping(specs):
+    """Rebuild the legacy dict-of-dicts mapping from the field specs"""
+    mapping = {}
+    for spec in specs:
+        entry = {'source_field': spec.source, 'required': spec.required}
+        if spec.transformer:
+            entry['transformer'] = spec.transformer
+        if spec.use_default:
+            entry['use_default'] = True
+        if spec.default is not None:
+            entry['default_value'] = spec.default
+        mapping[spec.target] = entry
+    return mapping
+
+# Backward-compatible view for callers that still expect the dict shape
+ARXIV_TO_ZOTERO_MAPPING = _as_mapping(ARXIV_FIELD_SPECS)
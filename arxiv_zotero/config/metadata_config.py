@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Any, Callable, List, Union, Optional
 from datetime import datetime
 import logging
@@ -5,207 +6,284 @@ import re
 
 logger = logging.getLogger(__name__)
 
-class MetadataMapper:
+# LaTeX cleanup patterns, compiled once at import time. Substitutions with
+# capture groups can't share a single alternation, so each pattern is kept
+# separate but precompiled instead of rebuilt per call.
+_LATEX_SUBS = tuple(
+    (re.compile(pattern), replacement) for pattern, replacement in (
+        (r'\n', ' '),  # Replace newlines with spaces
+        (r'\s+', ' '),  # Normalize multiple spaces
+        (r'\\textit\{([^}]*)\}', r'\1'),  # Replace \textit{} with content
+        (r'\\textbf\{([^}]*)\}', r'\1'),  # Replace \textbf{} with content
+        (r'\\emph\{([^}]*)\}', r'\1'),  # Replace \emph{} with content
+        (r'\\cite\{[^}]*\}', ''),  # Remove citations
+        (r'\\[a-zA-Z]+\{([^}]*)\}', r'\1'),  # Remove other common LaTeX commands
+        (r'\$([^$]*)\$', r'\1'),  # Remove inline math delimiters
+    )
+)
+
+# Common journal abbreviations mapping
+_JOURNAL_ABBREVIATIONS = {
+    'Physical Review': 'Phys. Rev.',
+    'Physical Review Letters': 'Phys. Rev. Lett.',
+    'Journal of High Energy Physics': 'JHEP',
+    # Add more as needed
+}
+
+# Journal reference patterns, assuming the common
+# "Journal Name Volume (Year) Pages" / "... Volume.Issue (Year) Pages" formats
+_JOURNAL_NAME_RE = re.compile(r'^([^0-9]+)')
+_JOURNAL_VOLUME_RE = re.compile(r'(\d+)\s*\(')
+_JOURNAL_ISSUE_RE = re.compile(r'(\d+)\.(\d+)')
+_JOURNAL_PAGES_RE = re.compile(r'\)\s*(\d+(?:-\d+)?)')
+
+@lru_cache(maxsize=8192)
+def _parse_journal_ref(journal_ref: str) -> Dict[str, Optional[str]]:
     """
-    An enhanced class to handle flexible mapping of arXiv metadata to Zotero format
+    Parse a journal reference string once for all derived fields
+
+    Five mapping entries feed off journal_ref; memoizing a single parse
+    means each distinct reference is scanned once instead of five times
+    per paper.
     """
-    
-    def __init__(self, mapping_config: Dict[str, Dict[str, Any]]):
-        """
-        Initialize with a mapping configuration
-        
-        Args:
-            mapping_config: Dictionary containing field mappings and transformers
-        """
-        self.mapping_config = mapping_config
+    abbrev = None
+    for full_name, abbreviation in _JOURNAL_ABBREVIATIONS.items():
+        if full_name in journal_ref:
+            abbrev = abbreviation
+            break
 
-    def transform_creators(self, authors: List[str]) -> List[Dict[str, str]]:
-        """
-        Transform author names into Zotero creator format with improved name parsing
-        """
-        creators = []
-        for name in authors:
-            # Handle cases with 'and' in author names
-            if ' and ' in name:
-                names = name.split(' and ')
+    name_match = _JOURNAL_NAME_RE.match(journal_ref)
+    volume_match = _JOURNAL_VOLUME_RE.search(journal_ref)
+    issue_match = _JOURNAL_ISSUE_RE.search(journal_ref)
+    pages_match = _JOURNAL_PAGES_RE.search(journal_ref)
+
+    return {
+        'abbrev': abbrev,
+        'name': name_match.group(1).strip() if name_match else None,
+        'volume': volume_match.group(1) if volume_match else None,
+        'issue': issue_match.group(2) if issue_match else None,
+        'pages': pages_match.group(1) if pages_match else None,
+    }
+
+@lru_cache(maxsize=4096)
+def _clean_latex_markup(text: str) -> str:
+    """Apply the precompiled LaTeX substitutions, memoized for repeat runs"""
+    cleaned = text
+    for pattern, replacement in _LATEX_SUBS:
+        cleaned = pattern.sub(replacement, cleaned)
+    return cleaned.strip()
+
+# Transformer functions. These live at module level so the field mapping can
+# reference them directly as callables resolved at import time, instead of
+# string names looked up with getattr per paper.
+
+def transform_creators(authors: List[str]) -> List[Dict[str, str]]:
+    """
+    Transform author names into Zotero creator format with improved name parsing
+    """
+    creators = []
+    for name in authors:
+        # Handle cases with 'and' in author names
+        if ' and ' in name:
+            names = name.split(' and ')
+        else:
+            names = [name]
+
+        for author in names:
+            # Split once: the parts double as whitespace normalization and
+            # as the word list for first/last name assignment
+            parts = author.split()
+            author = ' '.join(parts)
+
+            # Try to intelligently split the name
+            if ',' in author:  # Last, First format
+                last, _, first = author.partition(',')
+                creators.append({
+                    'creatorType': 'author',
+                    'firstName': first.strip(),
+                    'lastName': last.strip()
+                })
+            elif len(parts) > 1:  # First Last format
+                creators.append({
+                    'creatorType': 'author',
+                    'firstName': ' '.join(parts[:-1]),
+                    'lastName': parts[-1]
+                })
             else:
-                names = [name]
-                
-            for author in names:
-                # Remove extra whitespace
-                author = ' '.join(author.split())
-                
-                # Try to intelligently split the name
-                if ',' in author:  # Last, First format
-                    last, first = author.split(',', 1)
-                    creators.append({
-                        'creatorType': 'author',
-                        'firstName': first.strip(),
-                        'lastName': last.strip()
-                    })
-                else:  # First Last format
-                    parts = author.split()
-                    if len(parts) > 1:
-                        creators.append({
-                            'creatorType': 'author',
-                            'firstName': ' '.join(parts[:-1]),
-                            'lastName': parts[-1]
-                        })
-                    else:
-                        creators.append({
-                            'creatorType': 'author',
-                            'firstName': '',
-                            'lastName': author
-                        })
-        
-        return creators
-
-    def transform_date(self, date: datetime) -> str:
-        """Transform datetime to Zotero date format"""
-        return date.strftime('%Y-%m-%d')
-
-    def transform_tags(self, categories: List[str]) -> List[Dict[str, str]]:
-        """Transform categories into Zotero tags format with category cleaning"""
-        return [{'tag': cat.strip().lower()} for cat in categories if cat.strip()]
-
-    def clean_latex_markup(self, text: str) -> str:
-        """
-        Clean common LaTeX markup from text while preserving meaning
-        """
-        if not text:
-            return text
-            
-        # Common LaTeX replacements
-        replacements = {
-            r'\n': ' ',  # Replace newlines with spaces
-            r'\s+': ' ',  # Normalize multiple spaces
-            r'\\textit\{([^}]*)\}': r'\1',  # Replace \textit{} with content
-            r'\\textbf\{([^}]*)\}': r'\1',  # Replace \textbf{} with content
-            r'\\emph\{([^}]*)\}': r'\1',  # Replace \emph{} with content
-            r'\\cite\{[^}]*\}': '',  # Remove citations
-            r'\\[a-zA-Z]+\{([^}]*)\}': r'\1',  # Remove other common LaTeX commands
-            r'\$([^$]*)\$': r'\1',  # Remove inline math delimiters
-        }
-        
-        cleaned = text
-        for pattern, replacement in replacements.items():
-            cleaned = re.sub(pattern, replacement, cleaned)
-            
-        return cleaned.strip()
-
-    def extract_journal_abbrev(self, journal_ref: Optional[str]) -> Optional[str]:
-        """Extract journal abbreviation from journal reference"""
-        if not journal_ref:
-            return None
-            
-        # Common journal abbreviations mapping
-        abbreviations = {
-            'Physical Review': 'Phys. Rev.',
-            'Physical Review Letters': 'Phys. Rev. Lett.',
-            'Journal of High Energy Physics': 'JHEP',
-            # Add more as needed
-        }
-        
-        for full_name, abbrev in abbreviations.items():
-            if full_name in journal_ref:
-                return abbrev
-                
+                creators.append({
+                    'creatorType': 'author',
+                    'firstName': '',
+                    'lastName': author
+                })
+
+    return creators
+
+def transform_date(date: datetime) -> str:
+    """Transform datetime to Zotero date format"""
+    # isoformat hits a C fast path and emits the same YYYY-MM-DD string
+    # without walking a format spec per call
+    return date.date().isoformat() if isinstance(date, datetime) else date.isoformat()
+
+def transform_tags(categories: List[str]) -> List[Dict[str, str]]:
+    """Transform categories into Zotero tags format with category cleaning"""
+    return [{'tag': cat.strip().lower()} for cat in categories if cat.strip()]
+
+def clean_latex_markup(text: str) -> str:
+    """
+    Clean common LaTeX markup from text while preserving meaning
+    """
+    if not text:
+        return text
+
+    return _clean_latex_markup(text)
+
+def extract_journal_abbrev(journal_ref: Optional[str]) -> Optional[str]:
+    """Extract journal abbreviation from journal reference"""
+    if not journal_ref:
         return None
+    return _parse_journal_ref(journal_ref)['abbrev']
 
-    def extract_journal_name(self, journal_ref: Optional[str]) -> Optional[str]:
-        """Extract full journal name from journal reference"""
-        if not journal_ref:
-            return None
-            
-        # Try to extract journal name (assuming format: "Journal Name Volume (Year) Pages")
-        match = re.match(r'^([^0-9]+)', journal_ref)
-        if match:
-            return match.group(1).strip()
+def extract_journal_name(journal_ref: Optional[str]) -> Optional[str]:
+    """Extract full journal name from journal reference"""
+    if not journal_ref:
         return None
+    return _parse_journal_ref(journal_ref)['name']
 
-    def extract_volume(self, journal_ref: Optional[str]) -> Optional[str]:
-        """Extract volume number from journal reference"""
-        if not journal_ref:
-            return None
-            
-        # Try to extract volume (assuming format: "Journal Name Volume (Year) Pages")
-        match = re.search(r'(\d+)\s*\(', journal_ref)
-        if match:
-            return match.group(1)
+def extract_volume(journal_ref: Optional[str]) -> Optional[str]:
+    """Extract volume number from journal reference"""
+    if not journal_ref:
         return None
+    return _parse_journal_ref(journal_ref)['volume']
 
-    def extract_issue(self, journal_ref: Optional[str]) -> Optional[str]:
-        """Extract issue number from journal reference"""
-        if not journal_ref:
-            return None
-            
-        # Try to extract issue (assuming format: "Journal Name Volume.Issue (Year) Pages")
-        match = re.search(r'(\d+)\.(\d+)', journal_ref)
-        if match:
-            return match.group(2)
+def extract_issue(journal_ref: Optional[str]) -> Optional[str]:
+    """Extract issue number from journal reference"""
+    if not journal_ref:
         return None
+    return _parse_journal_ref(journal_ref)['issue']
 
-    def extract_pages(self, journal_ref: Optional[str]) -> Optional[str]:
-        """Extract page numbers from journal reference"""
-        if not journal_ref:
-            return None
-            
-        # Try to extract pages (assuming format: "Journal Name Volume (Year) Pages")
-        match = re.search(r'\)\s*(\d+(?:-\d+)?)', journal_ref)
-        if match:
-            return match.group(1)
+def extract_pages(journal_ref: Optional[str]) -> Optional[str]:
+    """Extract page numbers from journal reference"""
+    if not journal_ref:
         return None
+    return _parse_journal_ref(journal_ref)['pages']
+
+def transform_extra(extra_fields: Dict[str, Any]) -> str:
+    """Transform extra fields into a formatted string"""
+    extra_parts = []
 
-    def transform_extra(self, extra_fields: Dict[str, Any]) -> str:
-            """Transform extra fields into a formatted string"""
-            extra_parts = []
-            
-            if 'arxiv_id' in extra_fields and extra_fields['arxiv_id']:
-                extra_parts.append(f"arXiv: {extra_fields['arxiv_id']}")
-            if 'primary_category' in extra_fields and extra_fields['primary_category']:
-                extra_parts.append(f"Primary Category: {extra_fields['primary_category']}")
-            if 'comment' in extra_fields and extra_fields['comment']:
-                extra_parts.append(f"Comment: {extra_fields['comment']}")
-            if 'version' in extra_fields and extra_fields['version']:
-                extra_parts.append(f"Version: v{extra_fields['version']}")
-                
-            return '\n'.join(extra_parts)
-
-    def get_current_date(self, _: Any = None) -> str:
-        """Get current date in Zotero format"""
-        return datetime.now().strftime('%Y-%m-%d')
+    if 'arxiv_id' in extra_fields and extra_fields['arxiv_id']:
+        extra_parts.append(f"arXiv: {extra_fields['arxiv_id']}")
+    if 'primary_category' in extra_fields and extra_fields['primary_category']:
+        extra_parts.append(f"Primary Category: {extra_fields['primary_category']}")
+    if 'comment' in extra_fields and extra_fields['comment']:
+        extra_parts.append(f"Comment: {extra_fields['comment']}")
+    if 'version' in extra_fields and extra_fields['version']:
+        extra_parts.append(f"Version: v{extra_fields['version']}")
+
+    return '\n'.join(extra_parts)
+
+def get_current_date(_: Any = None) -> str:
+    """Get current date in Zotero format"""
+    return datetime.now().date().isoformat()
+
+class MetadataMapper:
+    """
+    An enhanced class to handle flexible mapping of arXiv metadata to Zotero format
+    """
+
+    # Transformers remain reachable as methods for backward compatibility;
+    # the module-level functions above are the canonical implementations
+    transform_creators = staticmethod(transform_creators)
+    transform_date = staticmethod(transform_date)
+    transform_tags = staticmethod(transform_tags)
+    clean_latex_markup = staticmethod(clean_latex_markup)
+    extract_journal_abbrev = staticmethod(extract_journal_abbrev)
+    extract_journal_name = staticmethod(extract_journal_name)
+    extract_volume = staticmethod(extract_volume)
+    extract_issue = staticmethod(extract_issue)
+    extract_pages = staticmethod(extract_pages)
+    transform_extra = staticmethod(transform_extra)
+    get_current_date = staticmethod(get_current_date)
+
+    def __init__(self, mapping_config: Dict[str, Dict[str, Any]]):
+        """
+        Initialize with a mapping configuration
+
+        Args:
+            mapping_config: Dictionary containing field mappings and transformers
+        """
+        self.mapping_config = mapping_config
+        # Precompile the mapping into a flat tuple of field plans so the
+        # per-paper hot loop avoids repeated dict lookups and transformer
+        # name resolution via getattr
+        self._compiled = tuple(
+            (
+                zotero_field,
+                mapping['source_field'],
+                self._resolve_transformer(mapping.get('transformer')),
+                mapping.get('required', False),
+                mapping.get('use_default', False),
+                mapping.get('default_value'),
+                'default_value' in mapping,
+            )
+            for zotero_field, mapping in mapping_config.items()
+        )
+        # Constant-default fields never vary per paper; seed the output with
+        # them up front and keep only the data-driven fields in the hot loop
+        self._static = {
+            zotero_field: default_value
+            for zotero_field, source_field, _, _, use_default, default_value, has_default in self._compiled
+            if source_field is None and use_default and has_default
+        }
+        self._dynamic = tuple(
+            plan for plan in self._compiled if plan[0] not in self._static
+        )
+
+    def _resolve_transformer(self, transformer: Union[str, Callable, None]) -> Optional[Callable]:
+        """Resolve a transformer entry (callable or legacy string name)"""
+        if transformer is None or callable(transformer):
+            return transformer
+        return getattr(self, transformer)
 
     def map_metadata(self, source_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map source metadata to Zotero format based on configuration with enhanced error handling
-        
+
         Args:
             source_data: Source metadata dictionary
-            
+
         Returns:
             Dict containing mapped metadata in Zotero format
         """
+        return self.map_into(source_data, {})
+
+    def map_into(self, source_data: Dict[str, Any], out: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map source metadata directly into an existing dict
+
+        Writing into the caller's dict (e.g. a copied item template)
+        skips the intermediate mapped dict and its merge copy.
+
+        Args:
+            source_data: Source metadata dictionary
+            out: Dictionary to write mapped fields into
+
+        Returns:
+            The out dict, for convenience
+        """
         try:
-            mapped_data = {}
-            
-            for zotero_field, mapping in self.mapping_config.items():
+            out.update(self._static)
+
+            for zotero_field, source_field, transformer, required, use_default, default_value, has_default in self._dynamic:
                 try:
-                    source_field = mapping['source_field']
-                    required = mapping.get('required', False)
-                    use_default = mapping.get('use_default', False)
-                    
                     # Handle fields with None source_field
                     if source_field is None:
-                        if use_default:
-                            if 'default_value' in mapping:
-                                mapped_data[zotero_field] = mapping['default_value']
-                            elif 'transformer' in mapping:
-                                transformer = getattr(self, mapping['transformer'])
-                                value = transformer(None)
-                                if value is not None:
-                                    mapped_data[zotero_field] = value
+                        if use_default and transformer is not None:
+                            value = transformer(None)
+                            if value is not None:
+                                out[zotero_field] = value
                         continue
-                    
+
                     # Handle multiple source fields
                     if isinstance(source_field, list):
                         value = {field: source_data.get(field) for field in source_field}
@@ -215,22 +293,21 @@ class MetadataMapper:
                                 raise ValueError(f"Required field '{source_field}' not found in source data")
                             continue
                         value = source_data[source_field]
-                    
+
                     # Apply transformer if specified
-                    if 'transformer' in mapping:
-                        transformer = getattr(self, mapping['transformer'])
+                    if transformer is not None:
                         value = transformer(value)
-                    
+
                     if value is not None:  # Only include non-None values
-                        mapped_data[zotero_field] = value
-                
+                        out[zotero_field] = value
+
                 except Exception as field_error:
                     logger.warning(f"Error mapping field '{zotero_field}': {str(field_error)}")
                     if required:
                         raise
-            
-            return mapped_data
-            
+
+            return out
+
         except Exception as e:
             logger.error(f"Error mapping metadata: {str(e)}")
-            raise
\ No newline at end of file
+            raise
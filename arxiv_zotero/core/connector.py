@@ -7,25 +7,20 @@ from ..utils.credentials import load_credentials
 from ..config.arxiv_config import ARXIV_TO_ZOTERO_MAPPING
 from ..config.metadata_config import MetadataMapper
 from .search_params import ArxivSearchParams
+from ..utils.paper_cache import PaperCache
 from ..utils.pdf_manager import PDFManager
 from ..clients.arxiv_client import ArxivClient
-from ..clients.zotero_client import ZoteroClient
+from ..clients.zotero_client import ZoteroClient, ZoteroAPIError
 from .paper_processor import PaperProcessor
 from ..utils.summarizer import PaperSummarizer
+from ..utils.logging_setup import configure_logging, shutdown_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('arxiv_zotero.log', mode='a', encoding='utf-8')
-    ]
-)
 logger = logging.getLogger(__name__)
 
 class ArxivZoteroCollector:
-    def __init__(self, zotero_library_id: str, zotero_api_key: str, collection_key: str = None, summarizer: Optional[PaperSummarizer] = None, config: Optional[dict] = None):
+    def __init__(self, zotero_library_id: str, zotero_api_key: str, collection_key: str = None, summarizer: Optional[PaperSummarizer] = None, config: Optional[dict] = None, max_concurrency: int = 15):
         self.collection_key = collection_key
+        self.max_concurrency = max_concurrency
         self.zotero_client = ZoteroClient(zotero_library_id, zotero_api_key, collection_key)
         self.metadata_mapper = MetadataMapper(ARXIV_TO_ZOTERO_MAPPING)
         self.pdf_manager = PDFManager()
@@ -36,82 +31,236 @@ class ArxivZoteroCollector:
             summarizer,
             config
         )
-        self.arxiv_client = ArxivClient()        
-        self.async_session = None
-        
+        self.arxiv_client = ArxivClient()
+        self.paper_cache = PaperCache()
+        self._existing_arxiv_ids = None
+
     def search_arxiv(self, search_params: ArxivSearchParams) -> List[Dict]:
         """Search arXiv using provided search parameters"""
         return self.arxiv_client.search_arxiv(search_params)
 
-    async def run_collection_async(self, search_params: ArxivSearchParams, download_pdfs: bool = True) -> Tuple[int, int]:
-        """Run collection process asynchronously using search parameters"""
+    async def run_collection_async(self, search_params: ArxivSearchParams, download_pdfs: bool = True, max_parallel_downloads: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Run collection process asynchronously using search parameters
+
+        Args:
+            search_params: arXiv search parameters
+            download_pdfs: Whether to download and attach PDFs
+            max_parallel_downloads: Cap on concurrent PDF downloads;
+                defaults to the collector-wide concurrency limit
+        """
+        # The arXiv search pages results with multi-second delays, so
+        # kick it off first and do the Zotero-side preparation
+        # (validation, library scan, template fetch) while it runs.
+        # Setup failures mean the run is misconfigured (bad collection key,
+        # unreachable library), not that individual papers failed — they
+        # propagate to the caller rather than being reported as a clean
+        # empty run.
+        search_task = asyncio.create_task(
+            self.arxiv_client.search_arxiv_async(search_params, skip_ids=self.paper_cache)
+        )
+        try:
+            await self.zotero_client.validate_collection_async()
+
+            # Pre-flight: one library scan so papers that are already in
+            # Zotero are skipped before any write or PDF download
+            if self._existing_arxiv_ids is None:
+                self._existing_arxiv_ids = await self.zotero_client.fetch_existing_arxiv_ids()
+
+            base_template = await self.zotero_client.get_item_template('journalArticle')
+        except BaseException:
+            search_task.cancel()
+            raise
+
+        papers = await search_task
+        logger.info("Found %d papers matching the criteria", len(papers))
+
+        if not papers:
+            return 0, 0
+
         try:
-            papers = self.search_arxiv(search_params)
-            logger.info(f"Found {len(papers)} papers matching the criteria")
-            
-            if not papers:
-                return 0, 0
-                
-            successful = 0
             failed = 0
-            
-            async def process_paper(paper):
-                nonlocal successful, failed
+            skipped = 0
+            failed_titles = []
+
+            # Pass 1: map metadata and build item templates (no network I/O),
+            # skipping papers already ingested on a previous run
+            templates = []
+            prepared_papers = []
+            for paper in papers:
+                arxiv_id = paper.get('arxiv_id')
+                if arxiv_id and (arxiv_id in self.paper_cache or arxiv_id in self._existing_arxiv_ids):
+                    logger.info("Skipping already-ingested paper %s", arxiv_id)
+                    skipped += 1
+                    continue
+                template = self.paper_processor.build_item_template(paper, base_template)
+                if template:
+                    templates.append(template)
+                    prepared_papers.append(paper)
+                else:
+                    failed += 1
+                    failed_titles.append(paper.get('title'))
+
+            # The semaphores keep in-flight work below the connector limit so
+            # large batches don't trigger connection-error storms or rate
+            # limits; downloads get their own cap so Zotero work and arXiv
+            # fetches don't starve each other.
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            download_semaphore = asyncio.Semaphore(max_parallel_downloads or self.max_concurrency)
+
+            async def download(paper):
+                try:
+                    async with download_semaphore:
+                        return await self.pdf_manager.download_pdf(
+                            url=paper['pdf_url'],
+                            title=paper['title']
+                        )
+                except Exception as e:
+                    logger.error("Error downloading PDF: %s", e)
+                    return None, None
+
+            # Pass 2: create all items through batched REST writes while the
+            # PDF downloads — which don't need item keys — run alongside
+            downloads_future = (
+                asyncio.gather(*(download(paper) for paper in prepared_papers))
+                if download_pdfs else None
+            )
+            try:
+                item_keys = await self.zotero_client.create_items_async(templates)
+            except BaseException as e:
+                # Don't orphan the in-flight downloads when creation fails;
+                # cancel and await them so no task outlives this call
+                if downloads_future is not None:
+                    downloads_future.cancel()
+                    try:
+                        await downloads_future
+                    except asyncio.CancelledError:
+                        pass
+                if not isinstance(e, ZoteroAPIError):
+                    raise
+                # A write failure here (auth rejection, exhausted retries)
+                # takes down the whole batch, so count every prepared paper
+                # as failed rather than reporting a clean (0, 0) run
+                logger.error("Item creation failed for all %d papers: %s", len(prepared_papers), e)
+                failed += len(prepared_papers)
+                failed_titles.extend(paper.get('title') for paper in prepared_papers)
+                logger.warning("Failed papers: %s", failed_titles[:10])
+                return skipped, failed
+            downloads = (
+                await downloads_future
+                if downloads_future is not None
+                else [(None, None)] * len(prepared_papers)
+            )
+
+            # Pass 3: build attachment templates; collection membership was
+            # already set on the item templates at creation time
+            async def prepare(paper, item_key, pdf_path, filename):
+                """Stage the attachment; upload is batched below"""
                 try:
-                    if await self.paper_processor.process_paper(paper, download_pdfs):
-                        successful += 1
-                    else:
-                        failed += 1
+                    async with semaphore:
+                        if not download_pdfs:
+                            return paper, item_key, None, None, True
+                        if not pdf_path or not filename:
+                            logger.error("Failed to download PDF")
+                            return paper, item_key, None, None, False
+                        attachment = await self.paper_processor.build_attachment(item_key, pdf_path, filename)
+                        if not attachment:
+                            return paper, item_key, None, None, False
+                        return paper, item_key, attachment, pdf_path, True
                 except Exception as e:
+                    logger.error("Error processing paper: %s", e)
+                    return paper, item_key, None, None, False
+
+            tasks = []
+            for paper, item_key, (pdf_path, filename) in zip(prepared_papers, item_keys, downloads):
+                if item_key:
+                    tasks.append(asyncio.create_task(prepare(paper, item_key, pdf_path, filename)))
+                else:
                     failed += 1
-                    logger.error(f"Error processing paper: {str(e)}")
-                
-            tasks = [process_paper(paper) for paper in papers]
-            await asyncio.gather(*tasks)
-                    
-            logger.info(f"Collection complete. Successfully processed {successful} papers. Failed: {failed}")
+                    failed_titles.append(paper.get('title'))
+
+            # Collect in completion order so progress is visible as papers
+            # finish instead of only after the slowest straggler; each result
+            # tuple carries its own paper, so order doesn't matter downstream
+            prepared_results = []
+            for finished in asyncio.as_completed(tasks):
+                prepared_results.append(await finished)
+                logger.info("Processed %d/%d papers", len(prepared_results), len(tasks))
+
+            # Pass 4: upload all downloaded PDFs in one batched call, then run
+            # summaries for the papers whose attachment went through
+            attachments = [attachment for _, _, attachment, _, ok in prepared_results if ok and attachment]
+            uploaded_parents = await self.zotero_client.upload_attachments_async(attachments)
+
+            successful = skipped
+            for paper, item_key, attachment, pdf_path, ok in prepared_results:
+                if not ok or (attachment and item_key not in uploaded_parents):
+                    failed += 1
+                    failed_titles.append(paper.get('title'))
+                    continue
+                if pdf_path:
+                    try:
+                        await self.paper_processor.summarize_paper(pdf_path, item_key)
+                    except Exception as e:
+                        logger.error("Error summarizing paper: %s", e)
+                successful += 1
+                if paper.get('arxiv_id'):
+                    self.paper_cache.add(paper['arxiv_id'], item_key)
+
+            self.paper_cache.save()
+
+            logger.info(
+                "Collection complete. Successfully processed %d papers (%d cached). Failed: %d",
+                successful, skipped, failed
+            )
+            if failed_titles:
+                logger.warning("Failed papers: %s", failed_titles[:10])
             return successful, failed
-            
+
         except Exception as e:
-            logger.error(f"Error in run_collection: {str(e)}")
+            logger.error("Error in run_collection: %s", e)
             return 0, 0
 
     async def close(self):
         """Cleanup resources"""
-        if self.async_session:
-            await self.async_session.close()
-        self.zotero_client.close()
+        await self.zotero_client.close_async()
         await self.pdf_manager.close()
 
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
 async def main():
-    collector = None
+    configure_logging()
     try:
         credentials = load_credentials()
-        collector = ArxivZoteroCollector(
+        async with ArxivZoteroCollector(
             zotero_library_id=credentials['library_id'],
             zotero_api_key=credentials['api_key'],
             collection_key=credentials['collection_key']
-        )
-        
-        # Example usage with ArxivSearchParams
-        search_params = ArxivSearchParams(
-            keywords=["multi-agent systems"],
-            max_results=10,
-            categories=["cs.AI"]
-        )
-        
-        successful, failed = await collector.run_collection_async(
-            search_params=search_params,
-            download_pdfs=True
-        )
-        
-        logger.info(f"Script completed. Successfully processed: {successful}, Failed: {failed}")
-        
+        ) as collector:
+            # Example usage with ArxivSearchParams
+            search_params = ArxivSearchParams(
+                keywords=["multi-agent systems"],
+                max_results=10,
+                categories=["cs.AI"]
+            )
+
+            successful, failed = await collector.run_collection_async(
+                search_params=search_params,
+                download_pdfs=True
+            )
+
+            logger.info(f"Script completed. Successfully processed: {successful}, Failed: {failed}")
+
     except Exception as e:
         logger.error(f"Script failed: {str(e)}")
     finally:
-        if collector:
-            await collector.close()
+        shutdown_logging()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,6 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
+def _to_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a date bound to tz-aware UTC once, at construction time"""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
 class ArxivSearchParams:
     """
     Data class for organizing arXiv search parameters
@@ -43,8 +51,8 @@ class ArxivSearchParams:
         self.keywords = keywords or []
         self.title_search = title_search
         self.categories = categories or []
-        self.start_date = start_date
-        self.end_date = end_date
+        self.start_date = _to_utc(start_date)
+        self.end_date = _to_utc(end_date)
         self.author = author
         self.content_type = content_type
         self.max_results = max_results
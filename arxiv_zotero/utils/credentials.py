@@ -29,20 +29,20 @@ def load_credentials(env_path: str = None) -> dict:
         if env_path and not os.path.exists(env_path):
             raise FileNotFoundError(f"Environment file not found: {env_path}")
         
-        # Define potential environment file locations in order of preference
-        env_locations = [
-            loc for loc in [
-                env_path if env_path else None,
-                '.env',
-                Path.home() / '.arxiv-zotero' / '.env',
-                Path('/etc/arxiv-zotero/.env')
-            ] if loc and os.path.exists(loc)
-        ]
-        
-        # Load the first available environment file
-        if env_locations:
-            load_dotenv(env_locations[0])
-            logger.info(f"Loaded environment from {env_locations[0]}")
+        # Potential environment file locations in order of preference;
+        # stop probing at the first hit instead of stat'ing every one
+        env_locations = (
+            env_path if env_path else None,
+            '.env',
+            Path.home() / '.arxiv-zotero' / '.env',
+            Path('/etc/arxiv-zotero/.env')
+        )
+
+        for location in env_locations:
+            if location and Path(location).is_file():
+                load_dotenv(location)
+                logger.info(f"Loaded environment from {location}")
+                break
         else:
             logger.warning("No environment file found, attempting to load from environment variables")
         
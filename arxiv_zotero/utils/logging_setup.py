@@ -0,0 +1,48 @@
+import logging
+import logging.handlers
+import queue
+
+_listener = None
+
+def configure_logging(level: int = logging.INFO, log_file: str = 'arxiv_zotero.log'):
+    """
+    Configure root logging through a QueueHandler/QueueListener pair
+
+    Log records are enqueued with a non-blocking put and written to the
+    console and log file by a background listener thread, so per-paper
+    logging never blocks the asyncio event loop on disk I/O.
+
+    Args:
+        level: Root log level
+        log_file: Path of the log file
+
+    Returns:
+        logging.handlers.QueueListener: The running listener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Keep the enqueued record unformatted; the listener's handlers apply
+    # the real format on the background thread
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    _listener.start()
+    return _listener
+
+def shutdown_logging():
+    """Stop the queue listener, flushing any pending records"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,57 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class PaperCache:
+    """Persistent record of already-ingested arXiv IDs"""
+
+    def __init__(self, cache_path: Path = None):
+        """
+        Initialize the paper cache
+
+        Args:
+            cache_path: Path to the cache file. Defaults to
+                        ~/.arxiv-zotero/seen.json
+        """
+        self.cache_path = cache_path or Path.home() / '.arxiv-zotero' / 'seen.json'
+        self._seen: Dict[str, Optional[str]] = {}
+        self._load()
+
+    def _load(self):
+        """Load previously seen arXiv IDs from disk"""
+        try:
+            if self.cache_path.exists():
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._seen = json.load(f)
+                logger.info(f"Loaded {len(self._seen)} cached arXiv IDs from {self.cache_path}")
+        except Exception as e:
+            logger.warning(f"Could not load paper cache {self.cache_path}: {str(e)}")
+            self._seen = {}
+
+    def __contains__(self, arxiv_id: str) -> bool:
+        return arxiv_id in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def get_item_key(self, arxiv_id: str) -> Optional[str]:
+        """Return the Zotero item key recorded for an arXiv ID, if any"""
+        return self._seen.get(arxiv_id)
+
+    def add(self, arxiv_id: str, item_key: Optional[str] = None):
+        """Record an arXiv ID as ingested"""
+        self._seen[arxiv_id] = item_key
+
+    def save(self):
+        """Persist the cache to disk atomically"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._seen, f)
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save paper cache {self.cache_path}: {str(e)}")
@@ -1,15 +1,31 @@
+import aiofiles
 import aiohttp
+import asyncio
 import logging
 import re
 import unicodedata
 from pathlib import Path
 from typing import Optional, Tuple
 
+from PyPDF2 import PdfReader
+
+from .rate_limiter import AsyncTokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Filename sanitization pattern, compiled once instead of per title
+_SANITIZE_RE = re.compile(r'[^\w\s-]')
+
+# Identify ourselves per arXiv's user-agent policy; anonymous clients
+# are throttled more aggressively
+USER_AGENT = 'arxiv-zotero-connector/0.1.0'
+
 class PDFManager:
     """Class to handle all PDF-related operations for arXiv papers"""
-    
+
+    # Chunk size for streaming downloads to disk
+    CHUNK_SIZE = 65536
+
     def __init__(self, download_dir: Path = None):
         """
         Initialize PDFManager
@@ -20,7 +36,33 @@ class PDFManager:
         self.download_dir = download_dir or Path.home() / 'Downloads' / 'arxiv_papers'
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.async_session = None
-        
+        # Smooth bursts against arXiv's courtesy rate expectations: small
+        # burst allowance, sustained one request per second
+        self._rate_limiter = AsyncTokenBucket(capacity=4, rate=1.0)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared download session, creating it lazily inside the
+        running event loop
+
+        A single long-lived session with a pooled connector keeps arXiv
+        connections warm across downloads instead of paying a TCP+TLS
+        handshake per PDF.
+        """
+        if self.async_session is None or self.async_session.closed:
+            self.async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={'User-Agent': USER_AGENT}
+            )
+        return self.async_session
+
+
     def _sanitize_filename(self, title: str, max_length: int = 100) -> str:
         """
         Convert paper title to a safe filename while preserving original casing.
@@ -36,7 +78,7 @@ class PDFManager:
         filename = unicodedata.normalize('NFKD', title).encode('ASCII', 'ignore').decode()
         
         # Replace non-alphanumeric characters with spaces, preserving case
-        filename = re.sub(r'[^\w\s-]', ' ', filename)
+        filename = _SANITIZE_RE.sub(' ', filename)
         
         # Replace multiple spaces with single space and strip
         filename = ' '.join(filename.split())
@@ -75,37 +117,86 @@ class PDFManager:
             
         return pdf_path
 
-    async def download_pdf(self, url: str, title: str) -> Tuple[Optional[Path], Optional[str]]:
+    def _validate_pdf(self, pdf_path: Path) -> bool:
+        """Check that a downloaded file is a complete, parseable PDF"""
+        try:
+            # Actually parse the document: a header sniff would accept
+            # truncated downloads, which PdfReader rejects
+            return len(PdfReader(pdf_path).pages) > 0
+        except Exception:
+            return False
+
+    async def download_pdf(self, url: str, title: str, max_retries: int = 3) -> Tuple[Optional[Path], Optional[str]]:
         """
         Download a PDF file and return its path and filename.
-        
+
+        The response is streamed to disk in chunks, and interrupted downloads
+        are resumed with an HTTP Range request instead of restarting from
+        byte zero.
+
         Args:
             url: URL of the PDF to download
             title: Title of the paper (for filename generation)
-            
+            max_retries: Number of download attempts before giving up
+
         Returns:
             Tuple[Optional[Path], Optional[str]]: Tuple of (file path, filename) if successful,
                                                 (None, None) if download fails
         """
-        if not self.async_session:
-            self.async_session = aiohttp.ClientSession()
+        # Reuse a prior run's download when a parseable PDF is already on
+        # disk — arXiv PDFs are immutable per version, so no conditional GET
+        # needed. Validation parses the document, so a truncated leftover
+        # from an interrupted run is never reused; delete it instead so the
+        # fresh download can take the base name back.
+        existing_path = self.download_dir / f"{self._sanitize_filename(title)}.pdf"
+        if existing_path.exists():
+            if self._validate_pdf(existing_path):
+                logger.info("Reusing existing PDF at %s", existing_path)
+                return existing_path, existing_path.name
+            logger.warning("Discarding invalid leftover PDF at %s", existing_path)
+            existing_path.unlink(missing_ok=True)
 
-        try:
-            pdf_path = self.get_unique_filepath(title)
-            
-            async with self.async_session.get(url) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    pdf_path.write_bytes(content)
-                    logger.info(f"Successfully downloaded PDF to {pdf_path}")
+        session = await self._get_session()
+
+        pdf_path = self.get_unique_filepath(title)
+
+        for attempt in range(max_retries):
+            try:
+                await self._rate_limiter.acquire()
+                existing_size = pdf_path.stat().st_size if pdf_path.exists() else 0
+                headers = {'Range': f'bytes={existing_size}-'} if existing_size else {}
+
+                async with session.get(url, headers=headers) as response:
+                    if response.status not in (200, 206):
+                        logger.error("Failed to download PDF. Status: %s", response.status)
+                        pdf_path.unlink(missing_ok=True)
+                        return None, None
+
+                    # Servers that ignore the Range header send the full file
+                    mode = 'ab' if response.status == 206 and existing_size else 'wb'
+                    async with aiofiles.open(pdf_path, mode) as f:
+                        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                            await f.write(chunk)
+
+                if self._validate_pdf(pdf_path):
+                    logger.info("Successfully downloaded PDF to %s", pdf_path)
                     return pdf_path, pdf_path.name
-                else:
-                    logger.error(f"Failed to download PDF. Status: {response.status}")
-                    return None, None
 
-        except Exception as e:
-            logger.error(f"Error downloading PDF: {str(e)}")
-            return None, None
+                # Corrupt payload: discard and retry from scratch
+                logger.warning("Downloaded file failed PDF validation, retrying: %s", pdf_path)
+                pdf_path.unlink(missing_ok=True)
+
+            except asyncio.CancelledError:
+                # Don't leave a partial behind when interrupted mid-stream
+                pdf_path.unlink(missing_ok=True)
+                raise
+            except Exception as e:
+                logger.warning("Error downloading PDF (attempt %d/%d): %s", attempt + 1, max_retries, e)
+
+        logger.error("Error downloading PDF from %s after %d attempts", url, max_retries)
+        if pdf_path.exists():
+            pdf_path.unlink(missing_ok=True)
+        return None, None
 
     def prepare_attachment_template(self, filename: str, parent_item: str, filepath: Path) -> dict:
         """
@@ -128,7 +219,7 @@ class PDFManager:
 
     async def close(self):
         """Cleanup resources"""
-        if self.async_session:
+        if self.async_session and not self.async_session.closed:
             await self.async_session.close()
 
     async def __aenter__(self):
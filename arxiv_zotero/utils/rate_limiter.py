@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for async HTTP clients
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Callers await acquire() before each request; when the bucket is empty
+    the caller sleeps just long enough for the next token, keeping request
+    throughput at the limit instead of bursting into 429 responses.
+    """
+
+    def __init__(self, capacity: float = 10, rate: float = 5.0):
+        """
+        Initialize the token bucket
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            rate: Token refill rate per second (sustained request rate)
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, cost: float = 1.0):
+        """Take `cost` tokens, sleeping until enough have refilled"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+
+    async def penalize(self, delay: float):
+        """
+        Drain the bucket after a rate-limit response so every caller backs
+        off for roughly `delay` seconds before new requests flow again
+        """
+        async with self._lock:
+            self._refill()
+            self.tokens = -delay * self.rate
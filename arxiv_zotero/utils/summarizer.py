@@ -66,12 +66,13 @@ class PaperSummarizer:
             with open(summary_path, 'w', encoding='utf-8') as f:
                 f.write(f"Summary of: {pdf_path.name}\n\n{summary}")
 
-            # Add note to Zotero if client and item_key provided
+            # Add note to Zotero if client and item_key provided; pyzotero is
+            # blocking, so keep it off the event loop
             if zotero_client and item_key:
-                note_template = zotero_client.zot.item_template('note')
+                note_template = await asyncio.to_thread(zotero_client.zot.item_template, 'note')
                 note_template['note'] = f"<p><strong>AI Generated Summary</strong></p><p>{summary}</p>"
                 note_template['parentItem'] = item_key
-                zotero_client.zot.create_items([note_template])
+                await asyncio.to_thread(zotero_client.zot.create_items, [note_template])
 
             return summary
 
@@ -23,22 +23,20 @@ setup(
         "Topic :: Scientific/Engineering",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
     keywords="arxiv, zotero, research, papers, academic, ai, summarization",
     packages=find_packages(exclude=["tests", "tests.*", "examples"]),
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
         "arxiv>=1.4.0",
         "pyzotero>=1.5.0",
         "requests>=2.25.0",
-        "pytz>=2021.1",
         "python-dotenv>=0.19.0",
         "aiohttp>=3.8.0",
+        "aiofiles>=23.1.0",
         "pyyaml>=5.4.0",
         "PyPDF2>=2.0.0",
         "google-generativeai>=0.3.0",